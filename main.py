@@ -6,31 +6,66 @@ and creates threaded replies with AI-powered financial sentiment analysis.
 
 Requirements (requirements.txt):
     feedparser
-    requests
+    aiohttp
+    cachetools
+    orjson
     groq>=0.11.0
     discord.py>=2.3.0
     python-dotenv>=1.0.0
+
+Optional:
+    fastembed, numpy    (semantic cache for near-duplicate tweets)
+    lxml                (incremental RSS parsing that stops at already-seen tweets)
+    uvloop              (faster event loop on Linux/macOS)
 """
 
 import asyncio
+import atexit
+import calendar
+import hashlib
+import io
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import sqlite3
+import sys
+import threading
+import time
 import feedparser
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html import unescape
 from pathlib import Path
 
+import aiohttp
 import discord
+import orjson
+from cachetools import LRUCache, TTLCache
 from discord.ext import tasks
 from groq import Groq
 from dotenv import load_dotenv
 
-# Set user agent for Nitter (some instances block default user agent)
-feedparser.USER_AGENT = "Mozilla/5.0 (compatible; TwitterBot/1.0; +https://github.com/alanwtom/TwitterBot)"
+try:
+    from lxml import etree
+except ImportError:
+    etree = None  # fall back to feedparser for every feed
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # default asyncio event loop
+
+# User agent for feed requests (some Nitter instances block the default one)
+USER_AGENT = "Mozilla/5.0 (compatible; TwitterBot/1.0; +https://github.com/alanwtom/TwitterBot)"
 
 # Load environment variables from .env file
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # ──────────────────────────────────────────────────────────────
 # CONFIG
 # ──────────────────────────────────────────────────────────────
@@ -49,14 +84,49 @@ GROQ_API_KEY = os.environ["GROQ_API_KEY"]
 GROQ_MODEL = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")
 
 POLL_INTERVAL = 120  # seconds between checks
+# Adaptive polling: poll quiet accounts less often, speed back up after new posts
+ADAPTIVE_POLLING_ENABLED = os.environ.get("ADAPTIVE_POLLING_ENABLED", "true").lower() == "true"
+POLL_INTERVAL_MIN = 60    # seconds
+POLL_INTERVAL_MAX = 1800  # seconds
+FETCH_TIMEOUT = 8  # seconds per RSS request; instances are probed concurrently
 # Use /data on Railway for persistent storage across restarts
 LAST_TWEET_FILE = os.environ.get("LAST_TWEET_FILE", "/data/last_tweet_id.txt")
+# Recent tweet IDs remembered in LAST_TWEET_FILE (never fewer than the feed's length)
+SEEN_IDS_LIMIT = int(os.environ.get("SEEN_IDS_LIMIT", "50"))
+# On first run (no LAST_TWEET_FILE) the current feed is marked as seen without posting;
+# set BOOTSTRAP_REPLAY=true to post and analyze it instead
+BOOTSTRAP_REPLAY = os.environ.get("BOOTSTRAP_REPLAY", "false").lower() == "true"
+# Feed state (ETag / Last-Modified validators) lives next to LAST_TWEET_FILE
+FEED_STATE_FILE = os.environ.get(
+    "FEED_STATE_FILE",
+    str(Path(LAST_TWEET_FILE).with_name("feed_state.json"))
+)
 SENTIMENT_ENABLED = os.environ.get("SENTIMENT_ENABLED", "true").lower() == "true"
 
 # Database configuration
 DB_PATH = os.environ.get("DB_PATH", "/data/sentiment.db")
 FLIP_ALERTS_ENABLED = os.environ.get("FLIP_ALERTS_ENABLED", "true").lower() == "true"
 
+# Exact-match analysis cache (same author + content reuses the previous result)
+ANALYSIS_CACHE_SIZE = 2048
+ANALYSIS_CACHE_TTL = 86400  # seconds
+
+# Batch new tweets into one Groq request; if disabled, tweets are analyzed concurrently
+SENTIMENT_BATCH_ENABLED = os.environ.get("SENTIMENT_BATCH_ENABLED", "true").lower() == "true"
+SENTIMENT_BATCH_SIZE = 10  # max tweets per batched request
+ANALYSIS_QUEUE_SIZE = 100  # posted tweets waiting for analysis before poll_feed blocks
+ANALYSIS_POST_CONCURRENCY = 5  # analysis threads being created on Discord at once
+
+# Semantic cache (optional, needs fastembed + numpy): paraphrased tweets reuse an analysis
+SEMANTIC_CACHE_ENABLED = os.environ.get("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_FILE = os.environ.get(
+    "SEMANTIC_CACHE_FILE",
+    str(Path(DB_PATH).with_name("semantic_cache.npy"))
+)
+SEMANTIC_CACHE_SIZE = 2048
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
 # Outage detection
 OUTAGE_ALERT_THRESHOLD = 3  # consecutive failures before alerting
 RECOVERY_ALERT_ENABLED = True  # alert when feed recovers after outage
@@ -75,28 +145,151 @@ TWITTER_BEARER_TOKEN = os.environ.get("TWITTER_BEARER_TOKEN", "").strip()
 # State tracking
 consecutive_failures = 0
 was_in_outage = False
+http_session = None  # aiohttp.ClientSession, created in on_ready and reused across polls
+analysis_task = None  # background analysis_worker task, started in on_ready
+preferred_instance = None  # Nitter instance that served the last successful fetch
+twitter_client = None  # tweepy.Client, created on first Twitter API fallback and reused
+twitter_user_ids = {}  # username -> Twitter user id, so get_user runs once per username
 
 # Ticker filtering: comma-separated list of tickers to analyze (e.g., "BTC,ETH,SOL")
 # If empty, all tweets are analyzed
 TICKER_FILTERS = os.environ.get("TICKER_FILTERS", "").split(",") if os.environ.get("TICKER_FILTERS") else []
+TICKER_FILTERS_UPPER = frozenset(f.strip().upper().lstrip("$") for f in TICKER_FILTERS if f.strip())
+
+# Symbols recognized without a leading "$" when deciding whether a tweet is worth analyzing
+KNOWN_TICKERS = os.environ.get(
+    "KNOWN_TICKERS",
+    "BTC,ETH,SOL,NVDA,AAPL,TSLA,SPY,QQQ,MSFT,AMZN,GOOG,META"
+).split(",")
 # ──────────────────────────────────────────────────────────────
 
 
-def load_last_id() -> str | None:
-    """Load the last processed tweet ID from disk."""
+def write_json_atomic(path: str, data) -> None:
+    """
+    Write data as JSON to path without ever leaving a partial file.
+
+    Writes to a temp file next to it, fsyncs, then renames it over path,
+    so a crash mid-write leaves the previous contents intact.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# In-memory copy of LAST_TWEET_FILE; the file only changes through save_seen_ids
+seen_ids_cache = None  # list of tweet IDs, newest first; None until loaded
+seen_id_set = frozenset()  # same IDs as seen_ids_cache, for O(1) membership checks
+seen_ids_legacy = False  # True while LAST_TWEET_FILE is still in the old single-ID format
+
+
+def load_seen_ids() -> list[str]:
+    """
+    Load recently processed tweet IDs, newest first.
+
+    LAST_TWEET_FILE holds a JSON list of IDs; the older format (a single bare
+    ID) is still accepted. The file is read once, then served from memory.
+    """
+    global seen_ids_cache, seen_id_set, seen_ids_legacy
+
+    if seen_ids_cache is None:
+        try:
+            with open(LAST_TWEET_FILE) as f:
+                raw = f.read().strip()
+        except FileNotFoundError:
+            raw = ""
+
+        try:
+            ids = json.loads(raw) if raw else []
+        except json.JSONDecodeError:
+            ids = raw
+        if not isinstance(ids, list):
+            # Old format: only the newest processed ID (see process_entries)
+            ids = [ids]
+            seen_ids_legacy = True
+        seen_ids_cache = [tweet_key(str(i)) for i in ids]
+        seen_id_set = frozenset(seen_ids_cache)
+
+    return seen_ids_cache
+
+
+def load_seen_id_set() -> frozenset:
+    """Recently processed tweet IDs as a set (kept in step with load_seen_ids)."""
+    load_seen_ids()
+    return seen_id_set
+
+
+def save_seen_ids(ids: list[str]) -> None:
+    """
+    Save recently processed tweet IDs (newest first) to disk.
+
+    Skips the write when the list hasn't changed.
+    """
+    global seen_ids_cache, seen_id_set, seen_ids_legacy
+
+    seen_ids_legacy = False
+    ids = [tweet_key(i) for i in ids]
+    if ids == seen_ids_cache:
+        return
+
+    write_json_atomic(LAST_TWEET_FILE, ids)
+    seen_ids_cache = ids
+    seen_id_set = frozenset(ids)
+
+
+def load_feed_state() -> dict:
+    """Load persisted feed state (conditional-GET validators) from disk."""
     try:
-        with open(LAST_TWEET_FILE) as f:
-            return f.read().strip() or None
-    except FileNotFoundError:
-        return None
+        with open(FEED_STATE_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_feed_state() -> None:
+    """Save feed state to disk so validators survive restarts."""
+    write_json_atomic(FEED_STATE_FILE, feed_state)
 
 
-def save_last_id(tweet_id: str) -> None:
-    """Save the last processed tweet ID to disk."""
-    # Ensure directory exists
-    Path(LAST_TWEET_FILE).parent.mkdir(parents=True, exist_ok=True)
-    with open(LAST_TWEET_FILE, "w") as f:
-        f.write(tweet_id)
+# Format: {"validators": {"rss_url": {"etag": str, "modified": str}},
+#          "ema_gap": float, "last_post_time": float}
+feed_state = load_feed_state()
+
+
+# RSS URL -> blake2b digest of the last body processed from it (in memory only)
+feed_body_hashes = {}
+
+
+def update_feed_validators(url: str, etag: str | None, modified: str | None) -> None:
+    """
+    Remember the ETag / Last-Modified returned for a feed URL.
+
+    They are sent back on the next poll so an unchanged feed comes back
+    as a bodyless 304 instead of a full download and parse.
+    """
+    validators = {"etag": etag, "modified": modified}
+    stored = feed_state.setdefault("validators", {})
+    if stored.get(url) != validators:
+        stored[url] = validators
+        save_feed_state()
+
+
+def save_feed_version(feed) -> None:
+    """
+    Remember the body hash and validators of a feed whose entries were handled.
+
+    fetch_rss only attaches them to the feed; storing them before the tweets
+    are posted would turn a failed poll into a 304 (and lost tweets) next time.
+    """
+    version = feed.get("feed_version") if isinstance(feed, dict) else None
+    if not version:
+        return
+    feed_body_hashes[version["url"]] = version["body_hash"]
+    update_feed_validators(version["url"], version["etag"], version["modified"])
 
 
 def build_rss_url(instance: str, username: str) -> str:
@@ -104,26 +297,77 @@ def build_rss_url(instance: str, username: str) -> str:
     return f"https://{instance}/{username}/rss"
 
 
+# Configured instances plus any nitter.* mirror, over http or https
+NITTER_URL_PATTERN = re.compile(
+    r"https?://(?:"
+    + "".join(re.escape(i.strip()) + "|" for i in NITTER_INSTANCES if i.strip())
+    + r"nitter\.[a-z0-9.-]+)",
+    re.IGNORECASE
+)
+
+
 def nitter_to_twitter(url: str) -> str:
-    """Convert any Nitter link to a twitter.com link."""
-    for instance in NITTER_INSTANCES:
-        url = url.replace(f"https://{instance}", "https://twitter.com")
-        url = url.replace(f"http://{instance}", "https://twitter.com")
-    return url.replace("http://", "https://")
+    """
+    Convert any Nitter link to a twitter.com link.
+
+    >>> nitter_to_twitter("https://nitter.net/user/status/1#m")
+    'https://twitter.com/user/status/1#m'
+    >>> nitter_to_twitter("http://nitter.privacyredirect.com/user/status/2")
+    'https://twitter.com/user/status/2'
+    >>> nitter_to_twitter("http://twitter.com/user/status/3")
+    'https://twitter.com/user/status/3'
+    """
+    url = NITTER_URL_PATTERN.sub("https://twitter.com", url, count=1)
+    if url.startswith("http://"):
+        url = "https://" + url[len("http://"):]
+    return url
+
+
+STATUS_ID_PATTERN = re.compile(r"/status/(\d+)")
+
+
+def tweet_key(entry_id: str) -> str:
+    """
+    Reduce a feed entry ID to the tweet's status ID.
+
+    Nitter puts the serving instance's hostname in each guid, so the same
+    tweet has a different entry ID on every instance. Seen-ID tracking uses
+    this key so switching instances doesn't make old tweets look new.
+
+    >>> tweet_key("https://nitter.net/user/status/123#m")
+    '123'
+    >>> tweet_key("123")
+    '123'
+    """
+    match = STATUS_ID_PATTERN.search(entry_id or "")
+    return match.group(1) if match else entry_id
+
+
+TICKER_PREFIX_PATTERN = re.compile(r"^\$+")
+
+
+def normalize_tickers(tickers) -> list[str]:
+    """
+    Normalize tickers from an analysis: strip leading "$", uppercase, dedupe.
+
+    >>> normalize_tickers(["$btc", "BTC", "$$eth", ""])
+    ['BTC', 'ETH']
+    """
+    normalized = (TICKER_PREFIX_PATTERN.sub("", t.strip()).upper() for t in tickers if isinstance(t, str))
+    return [t for t in dict.fromkeys(normalized) if t]
 
 
 def should_analyze(tickers: list) -> bool:
     """
     Check if analysis should proceed based on ticker filters.
+    Expects tickers already passed through normalize_tickers.
     Returns True if:
     - No filters are configured (analyze all), OR
     - At least one detected ticker matches the filter list
     """
-    if not TICKER_FILTERS:
+    if not TICKER_FILTERS_UPPER:
         return True
-    detected_upper = [t.upper().lstrip("$") for t in tickers]
-    filters_upper = [f.upper().lstrip("$") for f in TICKER_FILTERS]
-    return bool(set(detected_upper) & set(filters_upper))
+    return any(t in TICKER_FILTERS_UPPER for t in tickers)
 
 
 # ──────────────────────────────────────────────────────────────
@@ -222,17 +466,64 @@ def to_str(value, default=""):
     if value is None:
         return default
     if isinstance(value, list):
-        return json.dumps(value)
+        return orjson.dumps(value).decode()
     return str(value)
 
 
+# Single SQLite connection shared by all database helpers (opened by get_db)
+db_conn = None
+
+# Statements run on every analysis. The SQL text never varies, so SQLite's
+# per-connection statement cache (cached_statements) compiles each once.
+INSERT_HISTORY_SQL = """
+    INSERT OR REPLACE INTO sentiment_history
+    (tweet_id, tweet_url, author, content, tickers, sentiment, bull_case, bear_case, summary, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+DELETE_TICKERS_SQL = "DELETE FROM sentiment_tickers WHERE tweet_id = ?"
+INSERT_TICKERS_SQL = "INSERT INTO sentiment_tickers (tweet_id, ticker, sentiment, created_at) VALUES (?, ?, ?, ?)"
+# Tickers are passed as one JSON array so the text is the same for any count.
+# created_at can tie (one-second resolution), so rowid, which follows insertion
+# order, decides which row is the newest.
+LAST_SENTIMENTS_SQL = """
+    SELECT ticker, sentiment FROM (
+        SELECT ticker, sentiment, ROW_NUMBER() OVER (
+            PARTITION BY ticker ORDER BY created_at DESC, rowid DESC
+        ) AS recency
+        FROM sentiment_tickers
+        WHERE ticker IN (SELECT value FROM json_each(?))
+    )
+    WHERE recency = 1
+"""
+
+
+def get_db() -> sqlite3.Connection:
+    """
+    Return the shared SQLite connection, opening it on first use.
+
+    The connection is in autocommit mode (isolation_level=None) with WAL
+    journaling, and is closed at interpreter exit.
+    """
+    global db_conn
+
+    if db_conn is None:
+        # Ensure directory exists
+        Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+
+        db_conn = sqlite3.connect(
+            DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        db_conn.execute("PRAGMA journal_mode=WAL")
+        db_conn.execute("PRAGMA synchronous=NORMAL")
+        db_conn.execute("PRAGMA temp_store=MEMORY")
+        atexit.register(db_conn.close)
+
+    return db_conn
+
+
 def init_db() -> None:
     """Initialize the SQLite database and create tables if they don't exist."""
-    # Ensure directory exists
-    Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    cursor = get_db().cursor()
 
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS sentiment_history (
@@ -250,38 +541,70 @@ def init_db() -> None:
         )
     """)
 
+    # One row per (tweet, ticker) so per-ticker lookups can use an index
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sentiment_tickers (
+            tweet_id TEXT,
+            ticker TEXT,
+            sentiment TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
     # Create indexes for efficient queries
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickers ON sentiment_history(tickers)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON sentiment_history(created_at)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_ticker_sentiment ON sentiment_history(tickers, sentiment)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_st_ticker_time ON sentiment_tickers(ticker, created_at DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_st_tweet ON sentiment_tickers(tweet_id)")
+    # LIKE '%"TICKER"%' lookups could never use an index on the JSON blob
+    cursor.execute("DROP INDEX IF EXISTS idx_tickers")
+
+    # Backfill sentiment_tickers from existing history (first run after upgrade),
+    # in history id order so rowids follow the order the tweets were saved
+    cursor.execute("SELECT 1 FROM sentiment_tickers LIMIT 1")
+    if cursor.fetchone() is None:
+        cursor.execute("""
+            INSERT INTO sentiment_tickers (tweet_id, ticker, sentiment, created_at)
+            SELECT h.tweet_id, UPPER(LTRIM(j.value, '$')), UPPER(h.sentiment), h.created_at
+            FROM sentiment_history h, json_each(h.tickers) j
+            WHERE json_valid(h.tickers)
+            ORDER BY h.id, j.key
+        """)
+
+    log.info("[✓] Database initialized: %s", DB_PATH)
+
+
+# Most recent sentiment per ticker (None = no history); updated by save_sentiment
+last_sentiment_cache = LRUCache(maxsize=256)
+
 
-    conn.commit()
-    conn.close()
-    print(f"[✓] Database initialized: {DB_PATH}")
+pending_sentiments = []  # (history_row, ticker_rows) tuples waiting for flush_sentiments
 
 
 def save_sentiment(entry, analysis: dict) -> None:
     """
-    Save sentiment analysis to the database.
+    Queue a sentiment analysis for the database.
+
+    Rows are written by flush_sentiments() in one transaction per batch;
+    last_sentiment_cache is updated immediately so flip checks see them.
 
     Args:
         entry: The RSS feed entry
         analysis: The sentiment analysis dict from Groq
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
         # Extract content from entry
         content = entry.get('summary', entry.get('title', ''))
         author = entry.get('author', 'Unknown')
         tweet_url = nitter_to_twitter(entry.link)
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO sentiment_history
-            (tweet_id, tweet_url, author, content, tickers, sentiment, bull_case, bear_case, summary)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        tickers = analysis.get("tickers", [])
+        sentiment = to_str(analysis.get("sentiment", "NEUTRAL")).upper()
+        # Stamped now, not at flush: a batch shares one transaction, and
+        # CURRENT_TIMESTAMP would give every row the same second.
+        # Same UTC "YYYY-MM-DD HH:MM:SS" layout, plus microseconds.
+        created_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+        history_row = (
             entry.id,
             tweet_url,
             author,
@@ -290,45 +613,97 @@ def save_sentiment(entry, analysis: dict) -> None:
             to_str(analysis.get("sentiment", "NEUTRAL")),
             to_str(analysis.get("bull_case", "")),
             to_str(analysis.get("bear_case", "")),
-            to_str(analysis.get("summary", ""))
-        ))
+            to_str(analysis.get("summary", "")),
+            created_at
+        )
+        ticker_rows = [(entry.id, ticker, sentiment, created_at) for ticker in tickers]
+        pending_sentiments.append((history_row, ticker_rows))
 
-        conn.commit()
-        conn.close()
-        print(f"[✓] Saved to database: {analysis.get('tickers', [])}")
+        # This tweet is now the latest sentiment for each of its tickers
+        for ticker in tickers:
+            last_sentiment_cache[ticker] = sentiment
     except Exception as e:
-        print(f"[!] Database save error: {e}")
+        log.error("[!] Database save error: %s", e)
 
 
-def get_last_sentiment(ticker: str) -> str | None:
+def flush_sentiments() -> None:
+    """Write all queued sentiments to the database in a single transaction."""
+    if not pending_sentiments:
+        return
+
+    rows = pending_sentiments[:]
+    pending_sentiments.clear()
+
+    try:
+        cursor = get_db().cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(INSERT_HISTORY_SQL, [history_row for history_row, _ in rows])
+            cursor.executemany(DELETE_TICKERS_SQL, [(history_row[0],) for history_row, _ in rows])
+            cursor.executemany(
+                INSERT_TICKERS_SQL,
+                [ticker_row for _, ticker_rows in rows for ticker_row in ticker_rows]
+            )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        log.info("[✓] Saved %d analyses to database", len(rows))
+    except Exception as e:
+        # The cache may now hold sentiments that never reached the database
+        last_sentiment_cache.clear()
+        log.error("[!] Database save error: %s", e)
+
+
+def get_last_sentiments(tickers: list[str]) -> dict:
     """
-    Get the most recent sentiment for a specific ticker.
+    Get the most recent sentiment for several tickers (cached in memory).
+
+    Tickers not in the cache are looked up together in a single query.
 
     Args:
-        ticker: The ticker symbol to query (e.g., "BTC")
+        tickers: Normalized ticker symbols (e.g., ["BTC", "ETH"])
 
     Returns:
-        The sentiment string ("BUY", "SELL", "NEUTRAL") or None if not found
+        Dict mapping each ticker to "BUY"/"SELL"/"NEUTRAL", or None if not found
     """
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+    results = {}
+    missing = []
+    for ticker in tickers:
+        if ticker in last_sentiment_cache:
+            results[ticker] = last_sentiment_cache[ticker]
+        else:
+            missing.append(ticker)
 
-        # Query for most recent sentiment containing this ticker
-        cursor.execute("""
-            SELECT sentiment FROM sentiment_history
-            WHERE tickers LIKE ?
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (f'%"{ticker}"%',))
+    if not missing:
+        return results
 
-        result = cursor.fetchone()
-        conn.close()
+    try:
+        cursor = get_db().cursor()
+        cursor.execute(LAST_SENTIMENTS_SQL, (to_str(missing),))
+        found = dict(cursor.fetchall())
 
-        return result[0] if result else None
+        for ticker in missing:
+            results[ticker] = found.get(ticker)
+            last_sentiment_cache[ticker] = results[ticker]
     except Exception as e:
-        print(f"[!] Database query error: {e}")
-        return None
+        log.error("[!] Database query error: %s", e)
+
+    return results
+
+
+def get_last_sentiment(ticker: str) -> str | None:
+    """
+    Get the most recent sentiment for a specific ticker.
+
+    Args:
+        ticker: The ticker symbol to query (e.g., "BTC")
+
+    Returns:
+        The sentiment string ("BUY", "SELL", "NEUTRAL") or None if not found
+    """
+    return get_last_sentiments([ticker]).get(ticker)
 
 
 def check_sentiment_flip(analysis: dict) -> list[dict]:
@@ -355,13 +730,15 @@ def check_sentiment_flip(analysis: dict) -> list[dict]:
     if new_sentiment == "NEUTRAL":
         return flips
 
-    for ticker in analysis.get("tickers", []):
-        ticker_upper = ticker.upper().lstrip("$")
-        old_sentiment = get_last_sentiment(ticker_upper)
+    tickers = analysis.get("tickers", [])
+    last_sentiments = get_last_sentiments(tickers)
+
+    for ticker in tickers:
+        old_sentiment = last_sentiments.get(ticker)
 
         if old_sentiment and old_sentiment != "NEUTRAL" and old_sentiment != new_sentiment:
             flips.append({
-                "ticker": ticker_upper,
+                "ticker": ticker,
                 "old": old_sentiment,
                 "new": new_sentiment
             })
@@ -369,6 +746,17 @@ def check_sentiment_flip(analysis: dict) -> list[dict]:
     return flips
 
 
+# Embed styling per sentiment
+SENTIMENT_COLORS = {
+    "BUY": 0x57F287,      # Discord green
+    "SELL": 0xED4245,     # Discord red
+    "NEUTRAL": 0x5865F2,  # Discord blurple
+}
+SENTIMENT_EMOJIS = {"BUY": "🟢", "SELL": "🔴", "NEUTRAL": "⚪"}
+ANALYSIS_FOOTER = "AI-powered sentiment analysis • Llama 3.3 70B on Groq"
+FLIP_ALERT_FOOTER = "AI-powered sentiment tracking • Sentiment Flip Alert"
+
+
 async def send_flip_alert(channel, ticker: str, old_sentiment: str, new_sentiment: str) -> None:
     """
     Send a Discord alert when sentiment flips for a ticker.
@@ -379,17 +767,10 @@ async def send_flip_alert(channel, ticker: str, old_sentiment: str, new_sentimen
         old_sentiment: Previous sentiment (BUY/SELL)
         new_sentiment: New sentiment (BUY/SELL)
     """
-    # Color based on new sentiment
-    colors = {
-        "BUY": 0x57F287,      # Discord green
-        "SELL": 0xED4245,     # Discord red
-    }
-    color = colors.get(new_sentiment, 0x5865F2)
-
-    # Emoji for signals
-    emojis = {"BUY": "🟢", "SELL": "🔴"}
-    old_emoji = emojis.get(old_sentiment, "⚪")
-    new_emoji = emojis.get(new_sentiment, "⚪")
+    # Color and emojis based on sentiment
+    color = SENTIMENT_COLORS.get(new_sentiment, 0x5865F2)
+    old_emoji = SENTIMENT_EMOJIS.get(old_sentiment, "⚪")
+    new_emoji = SENTIMENT_EMOJIS.get(new_sentiment, "⚪")
 
     # Build description
     direction = "→"
@@ -400,74 +781,411 @@ async def send_flip_alert(channel, ticker: str, old_sentiment: str, new_sentimen
     )
 
     # Add context
-    old_ticker = get_last_sentiment(ticker)
     embed.add_field(
         name="Details",
         value=f"The sentiment signal for **${ticker}** has changed from **{old_sentiment}** to **{new_sentiment}**.",
         inline=False
     )
 
-    embed.set_footer(text="AI-powered sentiment tracking • Sentiment Flip Alert")
+    embed.set_footer(text=FLIP_ALERT_FOOTER)
     embed.timestamp = datetime.now()
 
     await channel.send(embed=embed)
-    print(f"[🚨] Flip alert sent: ${ticker} {old_sentiment} → {new_sentiment}")
+    log.info("[🚨] Flip alert sent: $%s %s → %s", ticker, old_sentiment, new_sentiment)
 
 
 # ──────────────────────────────────────────────────────────────
 # GROQ SENTIMENT ANALYSIS
 # ──────────────────────────────────────────────────────────────
 
-SENTIMENT_PROMPT = """You are a financial sentiment analyst. Analyze this tweet and extract:
+# Shared Groq client: reuses its HTTP connection pool across analyses
+groq_client = Groq(api_key=GROQ_API_KEY) if GROQ_API_KEY else None
+
+# Analyses keyed by a hash of (model, author, content); retweets and replayed entries skip Groq
+analysis_cache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL)
+# Analyses run in worker threads; guards analysis_cache and the semantic cache
+analysis_cache_lock = threading.Lock()
+
+# Static instructions go in the system message, byte-identical on every call, so
+# providers with prompt-prefix caching can reuse it. Only the tweet varies per request.
+SENTIMENT_PROMPT = """You are a financial sentiment analyst. Always respond with valid JSON only.
+
+Analyze the tweet in the user message and extract:
 1. Tickers/symbols mentioned (crypto: $BTC, $ETH; stocks: NVDA, AAPL)
 2. Sentiment: BUY, SELL, or NEUTRAL
 3. Bull case (2-3 bullet points max, reasons to be long)
 4. Bear case (2-3 bullet points max, reasons to be short/avoid)
 5. One-sentence summary
 
-Author: {author}
-Content: {content}
-
 Return valid JSON only:
-{{
+{
     "tickers": ["BTC", "ETH"],
     "sentiment": "BUY",
     "bull_case": "• Strong momentum\\n• Positive catalysts",
     "bear_case": "• Overbought conditions\\n• Risk of reversal",
     "summary": "One sentence summary here."
-}}
+}
 """
 
 
-def analyze_sentiment(entry) -> dict | None:
+# Format: {"np": module, "embedder": TextEmbedding, "vectors": ndarray | None,
+#          "entries": [{"symbols": [str], "analysis": dict}]}  (one entry per vector row)
+semantic_cache = None
+semantic_cache_unavailable = False
+# Guards loading and updating semantic_cache; separate from analysis_cache_lock
+# so a first-time model download doesn't hold up exact-cache hits
+semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> dict | None:
     """
-    Analyze a tweet's financial sentiment using Groq.
+    Lazily load the embedding model and the persisted semantic cache.
 
-    Returns a dict with tickers, sentiment, bull_case, bear_case, and summary,
-    or None if analysis fails.
+    Returns:
+        The cache dict, or None if disabled, fastembed/numpy are missing,
+        or the embedding model failed to load
+    """
+    global semantic_cache, semantic_cache_unavailable
+
+    if not SEMANTIC_CACHE_ENABLED or semantic_cache_unavailable:
+        return None
+    if semantic_cache is not None:
+        return semantic_cache
+
+    with semantic_cache_lock:
+        if semantic_cache is None and not semantic_cache_unavailable:
+            semantic_cache = load_semantic_cache()
+            semantic_cache_unavailable = semantic_cache is None
+    return semantic_cache
+
+
+def load_semantic_cache() -> dict | None:
+    """Load the embedding model and the persisted cache (called by get_semantic_cache)."""
+    try:
+        import numpy as np
+        from fastembed import TextEmbedding
+    except ImportError:
+        log.warning("[!] Semantic cache disabled (fastembed/numpy not installed)")
+        return None
+
+    vectors, entries = None, []
+    try:
+        with open(SEMANTIC_CACHE_FILE, "rb") as f:
+            vectors = np.load(f)
+        with open(Path(SEMANTIC_CACHE_FILE).with_suffix(".json")) as f:
+            entries = json.load(f)
+        # Older caches stored bare analyses without symbols, so hits couldn't be verified
+        if len(vectors) != len(entries) or not all(isinstance(e, dict) and "symbols" in e for e in entries):
+            vectors, entries = None, []
+    except (FileNotFoundError, ValueError):
+        vectors, entries = None, []
+
+    try:
+        embedder = TextEmbedding(EMBEDDING_MODEL)
+    except Exception as e:
+        # e.g. model download failed; don't retry on every batch
+        log.warning("[!] Semantic cache disabled (could not load %s: %s)", EMBEDDING_MODEL, e)
+        return None
+
+    cache = {
+        "np": np,
+        "embedder": embedder,
+        "vectors": vectors,
+        "entries": entries,
+    }
+    log.info("[✓] Semantic cache loaded (%d entries)", len(entries))
+    return cache
+
+
+def semantic_cache_lookup(content: str) -> tuple:
+    """
+    Find a cached analysis for a tweet that paraphrases an earlier one.
+
+    Only similarities at or above SEMANTIC_CACHE_THRESHOLD count as hits, and
+    only if the cached tweet mentions the same symbols ("$BTC breaking out"
+    must not reuse the analysis of "$ETH breaking out"); anything else falls
+    through to Groq.
+
+    Returns:
+        (embedding, analysis) tuple; analysis is None on a miss and
+        embedding is None when the semantic cache is unavailable
     """
-    client = Groq(api_key=GROQ_API_KEY)
+    cache = get_semantic_cache()
+    if cache is None:
+        return None, None
+
+    np = cache["np"]
+    try:
+        vector = next(iter(cache["embedder"].embed([content])))
+        vector = vector / np.linalg.norm(vector)
+    except Exception as e:
+        log.warning("[!] Semantic cache embedding error: %s", e)
+        return None, None
 
-    content = entry.get('summary', entry.get('title', ''))
-    author = entry.get('author', 'Unknown')
+    # semantic_cache_store swaps in new objects, so a matching pair is enough
+    with semantic_cache_lock:
+        vectors, entries = cache["vectors"], cache["entries"]
 
-    prompt = SENTIMENT_PROMPT.format(author=author, content=content)
+    # Vectors saved by a different embedding model can't be compared
+    if vectors is None or not len(vectors) or vectors.shape[1:] != vector.shape:
+        return vector, None
 
     try:
-        response = client.chat.completions.create(
+        similarities = vectors @ vector
+        candidates = np.flatnonzero(similarities >= SEMANTIC_CACHE_THRESHOLD)
+    except Exception as e:
+        log.warning("[!] Semantic cache lookup error: %s", e)
+        return None, None
+
+    symbols = tweet_symbols(content)
+    for i in sorted(candidates, key=lambda i: similarities[i], reverse=True):
+        if entries[i]["symbols"] == symbols:
+            log.info("[✓] Semantic cache hit (similarity %.2f)", similarities[i])
+            return vector, entries[i]["analysis"]
+
+    return vector, None
+
+
+def semantic_cache_store(vector, content: str, analysis: dict) -> None:
+    """Add a tweet's analysis to the semantic cache and persist it to disk."""
+    cache = get_semantic_cache()
+    if cache is None or vector is None:
+        return
+
+    np = cache["np"]
+    row = vector[np.newaxis, :]
+
+    with semantic_cache_lock:
+        vectors, entries = cache["vectors"], cache["entries"]
+        if vectors is not None and vectors.shape[1:] != vector.shape:
+            vectors, entries = None, []  # from another embedding model; start over
+        vectors = row if vectors is None else np.vstack([vectors, row])
+        entry = {"symbols": tweet_symbols(content), "analysis": analysis}
+        cache["vectors"] = vectors[-SEMANTIC_CACHE_SIZE:]
+        cache["entries"] = (entries + [entry])[-SEMANTIC_CACHE_SIZE:]
+
+        try:
+            # Same temp-file-then-rename pattern as write_json_atomic
+            path = Path(SEMANTIC_CACHE_FILE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, cache["vectors"])
+            os.replace(tmp_path, path)
+            write_json_atomic(path.with_suffix(".json"), cache["entries"])
+        except OSError as e:
+            log.warning("[!] Semantic cache save error: %s", e)
+
+
+# Tweets with no $CASHTAG and no known symbol can't produce tickers, so skip the LLM call
+KNOWN_SYMBOLS = sorted({t.strip().upper().lstrip("$") for t in KNOWN_TICKERS + TICKER_FILTERS if t.strip()})
+TICKER_PATTERN = re.compile(
+    r"\$[A-Za-z]{2,6}\b"
+    + (r"|\b(?:" + "|".join(map(re.escape, KNOWN_SYMBOLS)) + r")\b" if KNOWN_SYMBOLS else "")
+)
+
+
+def tweet_symbols(content: str) -> list[str]:
+    """
+    Ticker-like symbols mentioned in a tweet, normalized and sorted.
+
+    >>> tweet_symbols("$btc breaking out, BTC and $ETH")
+    ['BTC', 'ETH']
+    """
+    return sorted({match.upper().lstrip("$") for match in TICKER_PATTERN.findall(content)})
+
+
+# Tweet text sent to Groq is stripped of HTML and capped (quote chains can run to kilobytes)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+MAX_CONTENT_CHARS = 600
+MIN_CONTENT_CHARS = 10
+
+
+def clean_content(text: str) -> str:
+    """Strip HTML tags and entities from tweet text, collapse whitespace, and cap its length."""
+    text = unescape(HTML_TAG_PATTERN.sub(" ", text))
+    return " ".join(text.split())[:MAX_CONTENT_CHARS]
+
+
+def analysis_cache_key(author: str, content: str) -> str:
+    """Build the exact-match cache key for a tweet."""
+    key_data = {"model": GROQ_MODEL, "author": author, "content": content}
+    return hashlib.blake2b(orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def request_analysis(author: str, content: str) -> dict | None:
+    """Send a single tweet to Groq and return the parsed analysis, or None on error."""
+    try:
+        response = groq_client.chat.completions.create(
             model=GROQ_MODEL,
             messages=[
-                {"role": "system", "content": "You are a financial sentiment analyst. Always respond with valid JSON only."},
+                {"role": "system", "content": SENTIMENT_PROMPT},
+                {"role": "user", "content": f"Author: {author}\nContent: {content}"}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1,
+        )
+        return orjson.loads(response.choices[0].message.content)
+    except Exception as e:
+        log.error("[!] Groq error: %s", e)
+        return None
+
+
+def request_analysis_batch(tweets: list[tuple]) -> list | None:
+    """
+    Send several tweets to Groq in one request.
+
+    Args:
+        tweets: List of (author, content) tuples
+
+    Returns:
+        List of analyses in the same order as tweets (None for any tweet the
+        response didn't cover), or None if the request itself failed
+    """
+    tweet_lines = "\n\n".join(
+        f"[{i}] Author: {author}\nContent: {content}"
+        for i, (author, content) in enumerate(tweets)
+    )
+    prompt = (
+        f"Analyze each of the following {len(tweets)} tweets. Return a JSON object "
+        f'{{"results": [...]}} with one element per tweet in the same order. Each element '
+        f'uses the schema above plus an "index" field set to the tweet\'s [n] number.\n\n{tweet_lines}'
+    )
+
+    try:
+        response = groq_client.chat.completions.create(
+            model=GROQ_MODEL,
+            messages=[
+                {"role": "system", "content": SENTIMENT_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             response_format={"type": "json_object"},
             temperature=0.1,
         )
-        return json.loads(response.choices[0].message.content)
+        results = orjson.loads(response.choices[0].message.content).get("results")
     except Exception as e:
-        print(f"[!] Groq error: {e}")
+        log.error("[!] Groq batch error: %s", e)
+        return None
+
+    if not isinstance(results, list):
+        log.warning("[!] Groq batch response has no results list")
         return None
 
+    # Match results to tweets by their index field (falling back to position)
+    analyses = [None] * len(tweets)
+    for position, item in enumerate(results):
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.pop("index", position))
+        except (TypeError, ValueError):
+            index = position
+        if 0 <= index < len(tweets) and analyses[index] is None:
+            analyses[index] = item
+
+    missing = analyses.count(None)
+    if missing:
+        log.warning("[!] Groq batch missed %d of %d tweets", missing, len(tweets))
+    return analyses
+
+
+def analyze_sentiment_batch(entries: list) -> list[dict | None]:
+    """
+    Analyze the financial sentiment of several tweets using Groq.
+
+    Tweets without a ticker-like symbol are skipped and cached analyses are
+    reused; the rest are sent in batches of SENTIMENT_BATCH_SIZE per Groq
+    request. Tweets a batch response doesn't cover (or all of them, if the
+    batch request fails) are retried one request each.
+
+    Returns:
+        One analysis dict (tickers, sentiment, bull_case, bear_case, summary)
+        or None per entry, in the same order as entries
+    """
+    results = [None] * len(entries)
+    pending = []  # (index, author, content, cache_key, vector)
+
+    for i, entry in enumerate(entries):
+        content = clean_content(entry.get('summary') or entry.get('title') or '')
+        author = entry.get('author', 'Unknown')
+
+        if len(content) < MIN_CONTENT_CHARS:
+            log.info("[–] Tweet text too short, skipping analysis")
+            continue
+
+        if not TICKER_PATTERN.search(content):
+            log.info("[–] No ticker-like symbol in tweet, skipping analysis")
+            continue
+
+        cache_key = analysis_cache_key(author, content)
+        with analysis_cache_lock:
+            cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            log.info("[✓] Analysis cache hit")
+            results[i] = cached
+            continue
+
+        vector, cached = semantic_cache_lookup(content)
+        if cached is not None:
+            with analysis_cache_lock:
+                analysis_cache[cache_key] = cached
+            results[i] = cached
+            continue
+
+        pending.append((i, author, content, cache_key, vector))
+
+    for start in range(0, len(pending), SENTIMENT_BATCH_SIZE):
+        chunk = pending[start:start + SENTIMENT_BATCH_SIZE]
+        tweets = [(author, content) for _, author, content, _, _ in chunk]
+
+        analyses = request_analysis_batch(tweets) if len(chunk) > 1 else None
+        if analyses is None:
+            analyses = [None] * len(chunk)
+        analyses = [
+            analysis if analysis is not None else request_analysis(author, content)
+            for analysis, (author, content) in zip(analyses, tweets)
+        ]
+
+        for (i, _, content, cache_key, vector), analysis in zip(chunk, analyses):
+            if analysis is None:
+                continue
+            with analysis_cache_lock:
+                analysis_cache[cache_key] = analysis
+            semantic_cache_store(vector, content, analysis)
+            results[i] = analysis
+
+    return results
+
+
+def analyze_sentiment(entry) -> dict | None:
+    """
+    Analyze a tweet's financial sentiment using Groq.
+
+    Returns a dict with tickers, sentiment, bull_case, bear_case, and summary,
+    or None if analysis fails.
+    """
+    return analyze_sentiment_batch([entry])[0]
+
+
+async def analyze_entries(entries: list) -> list[dict | None]:
+    """
+    Analyze new tweets without blocking the event loop.
+
+    With SENTIMENT_BATCH_ENABLED the whole list goes through one batched call;
+    otherwise each tweet gets its own Groq request and the requests run
+    concurrently, so a burst takes max(latency) instead of sum(latency).
+    """
+    if SENTIMENT_BATCH_ENABLED:
+        return await asyncio.to_thread(analyze_sentiment_batch, entries)
+    return list(await asyncio.gather(
+        *(asyncio.to_thread(analyze_sentiment, entry) for entry in entries)
+    ))
+
+
+def truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, adding "..." if it was longer."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 def create_analysis_embed(analysis: dict) -> discord.Embed:
     """
@@ -477,30 +1195,20 @@ def create_analysis_embed(analysis: dict) -> discord.Embed:
         analysis: Sentiment analysis dict from Groq
     """
     sentiment = analysis.get("sentiment", "NEUTRAL").upper()
-
-    # Color based on sentiment
-    colors = {
-        "BUY": 0x57F287,      # Discord green
-        "SELL": 0xED4245,     # Discord red
-        "NEUTRAL": 0x5865F2,  # Discord blurple
-    }
-    color = colors.get(sentiment, 0x5865F2)
-
-    # Emoji for signal
-    emojis = {"BUY": "🟢", "SELL": "🔴", "NEUTRAL": "⚪"}
-    signal_emoji = emojis.get(sentiment, "⚪")
+    color = SENTIMENT_COLORS.get(sentiment, 0x5865F2)
+    signal_emoji = SENTIMENT_EMOJIS.get(sentiment, "⚪")
 
     # Format tickers
     tickers = analysis.get("tickers", [])
     if tickers:
-        ticker_display = " ".join(f"`${t}`" if not t.startswith("$") else f"`{t}`" for t in tickers[:5])
+        ticker_display = " ".join(f"`${t}`" for t in tickers[:5])
     else:
         ticker_display = "None detected"
 
     # Truncate long fields
-    bull_case = analysis.get('bull_case', '')[:350] + "..." if len(analysis.get('bull_case', '')) > 350 else analysis.get('bull_case', '')
-    bear_case = analysis.get('bear_case', '')[:350] + "..." if len(analysis.get('bear_case', '')) > 350 else analysis.get('bear_case', '')
-    summary = analysis.get('summary', '')[:400] + "..." if len(analysis.get('summary', '')) > 400 else analysis.get('summary', '')
+    bull_case = truncate(analysis.get('bull_case', ''), 350)
+    bear_case = truncate(analysis.get('bear_case', ''), 350)
+    summary = truncate(analysis.get('summary', ''), 400)
 
     embed = discord.Embed(
         title=f"{signal_emoji} {sentiment} Signal",
@@ -519,7 +1227,7 @@ def create_analysis_embed(analysis: dict) -> discord.Embed:
         embed.add_field(name="📝 Summary", value=summary, inline=False)
 
     # Add footer and timestamp
-    embed.set_footer(text="AI-powered sentiment analysis • Llama 3.3 70B on Groq")
+    embed.set_footer(text=ANALYSIS_FOOTER)
     embed.timestamp = datetime.now()
 
     return embed
@@ -529,30 +1237,52 @@ def create_analysis_embed(analysis: dict) -> discord.Embed:
 # DISCORD BOT
 # ──────────────────────────────────────────────────────────────
 
+class FeedBotClient(discord.Client):
+    """discord.Client that also closes the shared HTTP session on shutdown."""
+
+    async def close(self):
+        if http_session is not None and not http_session.closed:
+            await http_session.close()
+        await super().close()
+
+
 intents = discord.Intents.default()
-client = discord.Client(intents=intents)
+client = FeedBotClient(intents=intents)
 
 
 @client.event
 async def on_ready():
     """Called when the bot successfully connects to Discord."""
-    print(f"Logged in as {client.user}")
-    print(f"Username: @{DEFAULT_USERNAME}")
-    print(f"Nitter instances: {', '.join(NITTER_INSTANCES)}")
-    print(f"Health tracking: {'enabled' if HEALTH_TRACKING_ENABLED else 'disabled'}")
+    global http_session, analysis_task
+
+    log.info("Logged in as %s", client.user)
+    log.info("Username: @%s", DEFAULT_USERNAME)
+    log.info("Nitter instances: %s", ', '.join(NITTER_INSTANCES))
+    log.info("Health tracking: %s", 'enabled' if HEALTH_TRACKING_ENABLED else 'disabled')
     if RSS_BRIDGE_URL:
-        print(f"RSS-Bridge: {RSS_BRIDGE_URL}")
+        log.info("RSS-Bridge: %s", RSS_BRIDGE_URL)
     if TWITTER_BEARER_TOKEN:
-        print(f"Twitter API fallback: enabled (emergency only)")
+        log.info("Twitter API fallback: enabled (emergency only)")
     if TICKER_FILTERS:
-        print(f"Ticker filters: {', '.join(TICKER_FILTERS)}")
+        log.info("Ticker filters: %s", ', '.join(TICKER_FILTERS))
     else:
-        print(f"Ticker filters: None (analyzing all tweets)")
-    print(f"Polling every {POLL_INTERVAL}s")
+        log.info("Ticker filters: None (analyzing all tweets)")
+    log.info("Polling every %ss", POLL_INTERVAL)
 
     # Initialize database
     init_db()
-    print(f"Flip alerts: {'enabled' if FLIP_ALERTS_ENABLED else 'disabled'}\n")
+    log.info("Flip alerts: %s", 'enabled' if FLIP_ALERTS_ENABLED else 'disabled')
+
+    # One HTTP session for all feed fetches (keeps connections/TLS alive between polls)
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession(
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+        )
+
+    # Sentiment analysis runs in the background so polling isn't held up by Groq
+    if analysis_task is None or analysis_task.done():
+        analysis_task = asyncio.create_task(analysis_worker())
 
     # Wait a moment before starting polling loop
     await asyncio.sleep(2)
@@ -563,7 +1293,7 @@ async def on_ready():
 @client.event
 async def on_resumed():
     """Called when the bot resumes a connection."""
-    print(f"[✓] Connection resumed")
+    log.info("[✓] Connection resumed")
     if not poll_feed.is_running():
         poll_feed.start()
 
@@ -571,13 +1301,121 @@ async def on_resumed():
 @client.event
 async def on_disconnect():
     """Called when the bot disconnects."""
-    print(f"[!] Disconnected from Discord")
+    log.warning("[!] Disconnected from Discord")
+
+
+DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+
+
+def parse_rss_date(value: str | None):
+    """Parse an RSS pubDate into a UTC struct_time, like feedparser's published_parsed."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).utctimetuple()
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_rss_items(body: bytes, stop_ids: set):
+    """
+    Lazily yield RSS <item>s as feedparser-style entries, newest first.
+
+    Stops after the first item whose ID is in stop_ids. That item is still
+    yielded so the caller can tell the feed overlaps what it has already seen.
+    """
+    for _, item in etree.iterparse(io.BytesIO(body), tag="item", resolve_entities=False):
+        entry = feedparser.FeedParserDict(
+            id=item.findtext("guid") or item.findtext("link"),
+            link=item.findtext("link"),
+            title=item.findtext("title") or "",
+            summary=item.findtext("description") or "",
+        )
+        author = item.findtext(DC_CREATOR)
+        if author:
+            entry["author"] = author
+        published = parse_rss_date(item.findtext("pubDate"))
+        if published:
+            entry["published_parsed"] = published
+        item.clear()
+
+        yield entry
+        if tweet_key(entry.id) in stop_ids:
+            break
+
+
+def parse_feed(body: bytes, response_headers: dict, stop_ids: set):
+    """
+    Parse a feed body, stopping at the first already-seen item when possible.
+
+    RSS is read incrementally with lxml, so usually only the new items are
+    parsed. Atom feeds (RSS-Bridge), malformed XML, or a missing lxml fall
+    back to a full feedparser parse.
+    """
+    if etree is not None:
+        try:
+            entries = list(iter_rss_items(body, stop_ids))
+        except etree.XMLSyntaxError:
+            entries = []
+        if entries:
+            return feedparser.FeedParserDict(entries=entries)
+
+    return feedparser.parse(body, response_headers=response_headers)
+
+
+async def fetch_rss(url: str):
+    """
+    Fetch and parse an RSS/Atom feed without blocking the event loop.
+
+    Sends the stored ETag / Last-Modified validators as a conditional GET.
+    A 304 reply, or a body byte-identical to the last one processed from this
+    URL, returns an empty feed with status 304; otherwise the body is parsed
+    in a worker thread, stopping at the first already-seen tweet. The new
+    body hash and validators ride along in feed["feed_version"] until
+    save_feed_version() is called.
+
+    Raises:
+        aiohttp.ClientError: on connection errors or non-2xx responses
+    """
+    validators = feed_state.get("validators", {}).get(url, {})
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+
+    async with http_session.get(url, headers=headers) as response:
+        if response.status == 304:
+            return feedparser.FeedParserDict(entries=[], status=304)
+        response.raise_for_status()
+        body = await response.read()
+        status = response.status
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+
+    # Some instances ignore validators; an identical body is just as unchanged
+    body_hash = hashlib.blake2b(body, digest_size=8).digest()
+    if feed_body_hashes.get(url) == body_hash:
+        return feedparser.FeedParserDict(entries=[], status=304)
+
+    feed = await asyncio.to_thread(parse_feed, body, response_headers, load_seen_id_set())
+    feed["status"] = status
+    feed["feed_version"] = {
+        "url": url,
+        "body_hash": body_hash,
+        "etag": response_headers.get("etag"),
+        "modified": response_headers.get("last-modified"),
+    }
+    return feed
 
 
 async def fetch_from_nitter(instances: list, username: str) -> tuple:
     """
     Try to fetch RSS feed from Nitter instances.
 
+    The instance that worked last is tried alone first. If it fails, the
+    rest are probed concurrently; the first feed with entries wins, and a
+    304 / empty result is only used once every probe has finished.
+
     Args:
         instances: List of Nitter instance domains to try
         username: Twitter username to fetch
@@ -588,32 +1426,61 @@ async def fetch_from_nitter(instances: list, username: str) -> tuple:
         - working_instance: Instance that succeeded or None
         - success: True if at least one connection succeeded
     """
-    feed = None
-    working_instance = None
-    connection_succeeded = False
+    global preferred_instance
 
-    for instance in instances:
+    async def probe(instance):
         rss_url = build_rss_url(instance, username)
         try:
-            print(f"[*] Trying {instance}...", end=" ")
-            feed = feedparser.parse(rss_url)
-            connection_succeeded = True
-            update_instance_health(instance, True)
-
-            if feed.entries:
-                working_instance = instance
-                print(f"OK ({len(feed.entries)} entries)")
-                return feed, working_instance, True
-            else:
-                print(f"OK (0 entries - no new tweets)")
-                return feed, instance, True
+            feed = await asyncio.wait_for(fetch_rss(rss_url), FETCH_TIMEOUT)
         except Exception as e:
-            print(f"failed: {e}")
+            log.warning("[*] %s: failed: %s", instance, str(e) or type(e).__name__)
             update_instance_health(instance, False)
+            return instance, None
+        update_instance_health(instance, True)
+
+        # 304 Not Modified: nothing new since the last poll, body was skipped
+        if getattr(feed, "status", 200) == 304:
+            log.info("[*] %s: OK (304 not modified)", instance)
+        elif feed.entries:
+            log.info("[*] %s: OK (%d entries)", instance, len(feed.entries))
+        else:
+            log.info("[*] %s: OK (0 entries - no new tweets)", instance)
+        return instance, feed
+
+    # Stay on the instance that worked last time; each instance has its own
+    # validators and body hash, so hopping between them wastes both
+    if preferred_instance in instances:
+        instance, feed = await probe(preferred_instance)
+        if feed is not None:
+            return feed, instance, True
+        instances = [i for i in instances if i != preferred_instance]
+
+    # Otherwise probe the rest at once so dead ones cost one timeout, not one each
+    probes = [asyncio.create_task(probe(instance)) for instance in instances]
+    fallback = None  # (feed, instance) with nothing new; a 304 beats an empty feed
+
+    try:
+        for next_done in asyncio.as_completed(probes):
+            instance, feed = await next_done
+            if feed is None:
+                continue
+
+            not_modified = getattr(feed, "status", 200) == 304
+            if feed.entries and not not_modified:
+                preferred_instance = instance
+                return feed, instance, True
+
+            # Don't settle for "nothing new" while another probe may still have entries
+            if fallback is None or (not_modified and fallback[0].get("status") != 304):
+                fallback = (feed, instance)
+    finally:
+        for pending in probes:
+            pending.cancel()
 
     # If we at least connected to one instance (even if empty), return the feed
-    if connection_succeeded and feed is not None:
-        return feed, None, True
+    if fallback is not None:
+        preferred_instance = fallback[1]
+        return fallback[0], fallback[1], True
 
     return None, None, False
 
@@ -632,20 +1499,19 @@ async def fetch_from_rss_bridge(username: str) -> tuple:
         return None, False
 
     try:
-        print(f"[*] Trying RSS-Bridge...", end=" ")
         # RSS-Bridge Twitter bridge URL format
         url = f"{RSS_BRIDGE_URL}?action=display&bridge=Twitter&context=Username&u={username}&format=Atom"
-        feed = feedparser.parse(url)
+        feed = await fetch_rss(url)
 
         # Check if we got valid data
         if feed and hasattr(feed, 'entries'):
-            print(f"OK ({len(feed.entries)} entries)")
+            log.info("[*] RSS-Bridge: OK (%d entries)", len(feed.entries))
             return feed, True
         else:
-            print(f"failed: no entries")
+            log.warning("[*] RSS-Bridge: failed: no entries")
             return None, False
     except Exception as e:
-        print(f"RSS-Bridge failed: {e}")
+        log.warning("[*] RSS-Bridge failed: %s", e)
         return None, False
 
 
@@ -662,30 +1528,39 @@ async def fetch_from_twitter_api(username: str) -> tuple:
     Returns:
         (feed, success) tuple
     """
+    global twitter_client
+
     if not TWITTER_BEARER_TOKEN:
         return None, False
 
     try:
-        print(f"[*] Trying Twitter API (emergency fallback)...", end=" ")
+        log.info("[*] Trying Twitter API (emergency fallback)...")
 
-        import tweepy
+        if twitter_client is None:
+            import tweepy
+            twitter_client = tweepy.Client(bearer_token=TWITTER_BEARER_TOKEN)
 
-        # Fetch recent tweets using Twitter API v2
-        client = tweepy.Client(bearer_token=TWITTER_BEARER_TOKEN)
-        user = client.get_user(username=username)
+        # The user id never changes, so only look it up the first time
+        user_id = twitter_user_ids.get(username)
+        if user_id is None:
+            user = await asyncio.to_thread(twitter_client.get_user, username=username)
 
-        if not user.data:
-            print(f"failed: user not found")
-            return None, False
+            if not user.data:
+                log.warning("[*] Twitter API: failed: user not found")
+                return None, False
 
-        tweets = client.get_users_tweets(
-            id=user.data.id,
+            user_id = twitter_user_ids[username] = user.data.id
+
+        # Fetch recent tweets using Twitter API v2 (tweepy blocks, so off the event loop)
+        tweets = await asyncio.to_thread(
+            twitter_client.get_users_tweets,
+            id=user_id,
             max_results=10,
             tweet_fields=["created_at", "author_id", "public_metrics"]
         )
 
         if not tweets.data:
-            print(f"OK (0 entries - no new tweets)")
+            log.info("[*] Twitter API: OK (0 entries - no new tweets)")
             # Return empty feed-like structure
             return type('obj', (object,), {'entries': []}), True
 
@@ -704,14 +1579,14 @@ async def fetch_from_twitter_api(username: str) -> tuple:
             'entries': [FeedEntry(tweet) for tweet in tweets.data]
         })
 
-        print(f"OK ({len(feed.entries)} entries)")
+        log.info("[*] Twitter API: OK (%d entries)", len(feed.entries))
         return feed, True
 
     except ImportError:
-        print(f"Twitter API not available (tweepy not installed)")
+        log.warning("[*] Twitter API not available (tweepy not installed)")
         return None, False
     except Exception as e:
-        print(f"Twitter API failed: {e}")
+        log.warning("[*] Twitter API failed: %s", e)
         return None, False
 
 
@@ -735,7 +1610,7 @@ async def fetch_feed_with_retry(channel, retry_count=0) -> tuple:
         return feed, working_instance
 
     # If all Nitter instances failed, try RSS-Bridge
-    print(f"[!] All Nitter instances failed, trying RSS-Bridge fallback...")
+    log.warning("[!] All Nitter instances failed, trying RSS-Bridge fallback...")
     feed, rss_bridge_success = await fetch_from_rss_bridge(DEFAULT_USERNAME)
 
     if rss_bridge_success and feed:
@@ -743,7 +1618,7 @@ async def fetch_feed_with_retry(channel, retry_count=0) -> tuple:
 
     # If RSS-Bridge also failed, try Twitter API as last resort
     if TWITTER_BEARER_TOKEN:
-        print(f"[!] RSS-Bridge failed, trying Twitter API fallback...")
+        log.warning("[!] RSS-Bridge failed, trying Twitter API fallback...")
         feed, api_success = await fetch_from_twitter_api(DEFAULT_USERNAME)
 
         if api_success and feed:
@@ -786,6 +1661,131 @@ async def send_outage_alert(channel, consecutive: int, is_recovery: bool = False
     await channel.send(embed=embed)
 
 
+def update_poll_interval(newest_post_time: float | None = None) -> None:
+    """
+    Adapt the polling interval to how often the account posts.
+
+    Keeps an exponential moving average of the gap between posts (persisted
+    in feed_state) and polls about four times per average gap, clamped to
+    POLL_INTERVAL_MIN..POLL_INTERVAL_MAX.
+
+    Args:
+        newest_post_time: Unix timestamp of the newest new post, if any
+    """
+    if not ADAPTIVE_POLLING_ENABLED:
+        return
+
+    last_post_time = feed_state.get("last_post_time")
+    ema_gap = feed_state.get("ema_gap")
+
+    if newest_post_time is not None:
+        if last_post_time is not None and newest_post_time > last_post_time:
+            gap = newest_post_time - last_post_time
+            ema_gap = gap if ema_gap is None else 0.7 * ema_gap + 0.3 * gap
+            feed_state["ema_gap"] = ema_gap
+        last_post_time = max(newest_post_time, last_post_time or 0)
+        feed_state["last_post_time"] = last_post_time
+        save_feed_state()
+
+    if ema_gap is None:
+        return  # need at least two posts before adapting
+
+    desired = min(max(ema_gap / 4, POLL_INTERVAL_MIN), POLL_INTERVAL_MAX)
+    current = poll_feed.seconds or POLL_INTERVAL
+    if abs(desired - current) > 0.2 * current:
+        poll_feed.change_interval(seconds=desired)
+        log.info("[⏱] Poll interval changed: %.0fs → %.0fs", current, desired)
+
+
+# Posted tweets waiting for sentiment analysis: (discord.Message, entry) pairs
+analysis_queue = asyncio.Queue(maxsize=ANALYSIS_QUEUE_SIZE)
+
+
+async def post_analysis(message: discord.Message, entry, analysis: dict | None) -> None:
+    """
+    Save an analysis, send any flip alerts, and reply with the analysis
+    embed in a thread under the tweet's message.
+
+    Args:
+        message: The Discord message containing the tweet URL
+        entry: The RSS feed entry
+        analysis: The sentiment analysis dict from Groq, or None
+    """
+    if not analysis:
+        return
+
+    # Normalize once here; everything downstream relies on it
+    analysis["tickers"] = normalize_tickers(analysis.get("tickers") or [])
+    if not analysis["tickers"]:
+        return
+
+    # Check if we should analyze based on ticker filters
+    if not should_analyze(analysis["tickers"]):
+        log.info("[–] Skipped analysis (filtered tickers: %s)", analysis['tickers'])
+        return
+
+    # Check for sentiment flips against history before this tweet is saved into it
+    flips = check_sentiment_flip(analysis)
+
+    # Save to database for historical tracking (written by flush_sentiments)
+    save_sentiment(entry, analysis)
+
+    # Send flip alerts
+    for flip in flips:
+        await send_flip_alert(
+            message.channel,
+            flip["ticker"],
+            flip["old"],
+            flip["new"]
+        )
+
+    sentiment = analysis.get("sentiment", "NEUTRAL").upper()
+    thread_name = f"{SENTIMENT_EMOJIS.get(sentiment, '⚪')} {sentiment} · {' '.join(analysis['tickers'][:5])}"
+    thread = await message.create_thread(name=thread_name[:100])
+    await thread.send(embed=create_analysis_embed(analysis))
+    log.info("[✓] Sent analysis for %s: %s", analysis['tickers'], message.content)
+
+
+async def analysis_worker():
+    """
+    Background consumer for analysis_queue.
+
+    Keeps Groq latency out of poll_feed: tweets are posted immediately and
+    their analysis threads appear once the worker gets to them. Everything
+    queued at once is analyzed together (see analyze_entries).
+    """
+    while True:
+        items = [await analysis_queue.get()]
+        while not analysis_queue.empty():
+            items.append(analysis_queue.get_nowait())
+
+        try:
+            analyses = await analyze_entries([entry for _, entry in items])
+
+            # Overlap the Discord round-trips of different tweets. post_analysis
+            # checks flips and saves before its first await, so tasks started in
+            # queue order still see each other's sentiments in that order.
+            semaphore = asyncio.Semaphore(ANALYSIS_POST_CONCURRENCY)
+
+            async def post(message, entry, analysis):
+                async with semaphore:
+                    await post_analysis(message, entry, analysis)
+
+            results = await asyncio.gather(
+                *(post(message, entry, analysis) for (message, entry), analysis in zip(items, analyses)),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    log.error("[!] Error posting analysis: %s", result)
+        except Exception as e:
+            log.exception("[!] Analysis worker error: %s", e)
+        finally:
+            flush_sentiments()
+            for _ in items:
+                analysis_queue.task_done()
+
+
 @tasks.loop(seconds=POLL_INTERVAL)
 async def poll_feed():
     """
@@ -796,7 +1796,7 @@ async def poll_feed():
 
     channel = client.get_channel(DISCORD_CHANNEL_ID)
     if not channel:
-        print("[!] Channel not found")
+        log.warning("[!] Channel not found")
         return
 
     # Try to fetch feed
@@ -805,135 +1805,180 @@ async def poll_feed():
     # Only treat None feed as outage (empty feed is OK - just no new tweets)
     if feed is None:
         consecutive_failures += 1
-        print(f"[–] All instances failed to connect ({datetime.now().strftime('%H:%M:%S')})")
+        log.warning("[–] All instances failed to connect")
 
         # Send outage alert after threshold
         if consecutive_failures == OUTAGE_ALERT_THRESHOLD:
             was_in_outage = True
-            print(f"[⚠️] Outage alert: {consecutive_failures} consecutive failures")
+            log.warning("[⚠️] Outage alert: %s consecutive failures", consecutive_failures)
             await send_outage_alert(channel, consecutive_failures, is_recovery=False)
         return
 
     # Reset failure counter on successful connection (even if empty)
     if consecutive_failures >= OUTAGE_ALERT_THRESHOLD and was_in_outage:
-        print(f"[✅] Feed recovered after {consecutive_failures} failures")
+        log.info("[✅] Feed recovered after %s failures", consecutive_failures)
         if RECOVERY_ALERT_ENABLED:
             await send_outage_alert(channel, consecutive_failures, is_recovery=True)
         was_in_outage = False
 
     consecutive_failures = 0
+    update_poll_interval()
+
+    # Feed unchanged since last poll (conditional GET)
+    if getattr(feed, "status", 200) == 304:
+        log.info("[–] No new posts, feed not modified")
+        return
+
+    try:
+        await process_entries(channel, feed.entries)
+    except Exception as e:
+        log.exception("[!] Error: %s", e)
+        return
 
+    # Only now may an unchanged feed be skipped on later polls
+    save_feed_version(feed)
+
+
+async def process_entries(channel, entries) -> None:
+    """
+    Post unseen entries (oldest first), queue them for analysis, and
+    remember their IDs.
+
+    Args:
+        channel: Discord channel to post to
+        entries: Feed entries, newest first
+    """
     # Check if feed has entries
-    if not feed.entries:
-        print(f"[–] No entries in feed ({datetime.now().strftime('%H:%M:%S')})")
+    if not entries:
+        log.info("[–] No entries in feed")
         return
 
-    entries = feed.entries
+    # Load recently processed IDs
+    seen_ids = load_seen_ids()
+    seen = load_seen_id_set()
+    # Never remember fewer IDs than the feed holds, or still-listed tweets would repost
+    seen_limit = max(SEEN_IDS_LIMIT, len(entries))
 
-    try:
-        # Load last processed ID
-        last_id = load_last_id()
-
-        # Find new entries (newest first)
-        new_entries = []
-        found_last_id = False
-        for entry in entries:
-            if entry.id == last_id:
-                found_last_id = True
-                break
-            new_entries.append(entry)
-
-        # If we didn't find last_id, check if we have a gap
-        if not found_last_id and last_id:
-            print(f"[⚠️] Gap detected! last_id={last_id} not in feed ({len(entries)} entries)")
-            print(f"[⚠️] Tweets may have been missed during outage")
-
-            # Optional: Send alert about potential missed tweets
-            embed = discord.Embed(
-                title="🚨 Potential Missed Tweets",
-                description=f"Last processed tweet ID (`{last_id[:20]}...`) not found in current feed of {len(entries)} entries. "
-                           f"Any tweets posted during the outage may have been lost.",
-                color=0xFEE75C  # yellow
-            )
-            embed.add_field(name="Current feed range", value=f"From: `{entries[-1].id[:20]}...`\nTo: `{entries[0].id[:20]}...`", inline=False)
-            embed.set_footer(text="Consider checking the account directly for missed content")
-            embed.timestamp = datetime.now()
-            await channel.send(embed=embed)
+    # Warm start: seed the seen IDs from the current feed instead of posting all of it
+    if not seen_ids and not BOOTSTRAP_REPLAY:
+        save_seen_ids([tweet_key(entry.id) for entry in entries][:seen_limit])
+        log.info("[i] Warm start, marked %d existing entries as seen", len(entries))
+        return
 
-            # Process all current entries to get back on track
-            new_entries = list(entries)
+    # Find new entries (newest first). A set lookup instead of scanning up to
+    # the last ID means a pruned last ID can't cause already-sent tweets to repeat.
+    new_entries = [entry for entry in entries if tweet_key(entry.id) not in seen]
+
+    # An old single-ID file only names the newest tweet it posted; everything
+    # after it in the feed is older and was posted too
+    if seen_ids_legacy:
+        keys = [tweet_key(entry.id) for entry in entries]
+        if seen_ids[0] in keys:
+            new_entries = entries[:keys.index(seen_ids[0])]
+            if not new_entries:
+                save_seen_ids(keys[:seen_limit])
+
+    # If none of the current entries were seen before, we have a gap
+    if seen and len(new_entries) == len(entries):
+        last_id = seen_ids[0]
+        log.warning("[⚠️] Gap detected! last_id=%s not in feed (%s entries)", last_id, len(entries))
+        log.warning("[⚠️] Tweets may have been missed during outage")
+
+        # Optional: Send alert about potential missed tweets
+        embed = discord.Embed(
+            title="🚨 Potential Missed Tweets",
+            description=f"Last processed tweet ID (`{last_id[:20]}...`) not found in current feed of {len(entries)} entries. "
+                       f"Any tweets posted during the outage may have been lost.",
+            color=0xFEE75C  # yellow
+        )
+        embed.add_field(name="Current feed range", value=f"From: `{entries[-1].id[:20]}...`\nTo: `{entries[0].id[:20]}...`", inline=False)
+        embed.set_footer(text="Consider checking the account directly for missed content")
+        embed.timestamp = datetime.now()
+        await channel.send(embed=embed)
 
-        if not new_entries:
-            print(f"[–] No new posts ({datetime.now().strftime('%H:%M:%S')})")
-            return
+        # All current entries are unseen, so all of them get processed to get back on track
+
+    if not new_entries:
+        log.info("[–] No new posts")
+        return
 
-        # Process oldest first for chronological order
-        for entry in reversed(new_entries):
-            twitter_url = nitter_to_twitter(entry.link)
-
-            # Log timing info to diagnose delays
-            tweet_time = entry.get('published_parsed')
-            if tweet_time:
-                tweet_dt = datetime(*tweet_time[:6])
-                now_dt = datetime.now()
-                lag_seconds = int((now_dt - tweet_dt).total_seconds())
-                print(f"[🕐] Tweet: {tweet_dt.strftime('%H:%M:%S')} | Sent: {now_dt.strftime('%H:%M:%S')} | Lag: {lag_seconds}s")
-            else:
-                print(f"[🕐] Tweet time: unknown | Sent: {datetime.now().strftime('%H:%M:%S')}")
-
-            # Try sentiment analysis first
-            if SENTIMENT_ENABLED:
-                analysis = analyze_sentiment(entry)
-                if analysis and analysis.get("tickers"):
-                    # Check if we should analyze based on ticker filters
-                    if should_analyze(analysis["tickers"]):
-                        # Save to database for historical tracking
-                        save_sentiment(entry, analysis)
-
-                        # Check for sentiment flips and send alerts
-                        flips = check_sentiment_flip(analysis)
-                        for flip in flips:
-                            await send_flip_alert(
-                                channel,
-                                flip["ticker"],
-                                flip["old"],
-                                flip["new"]
-                            )
-
-                        # Send tweet URL and analysis in one message
-                        embed = create_analysis_embed(analysis)
-                        await channel.send(content=twitter_url, embed=embed)
-                        print(f"[✓] Sent analysis for {analysis['tickers']}: {twitter_url}")
-                        continue  # Skip the fallback send
-                    else:
-                        print(f"[–] Skipped analysis (filtered tickers: {analysis['tickers']})")
-
-            # Fallback: send bare tweet URL if analysis disabled or failed
-            await channel.send(twitter_url)
-            print(f"[✓] Sent: {twitter_url}")
-
-        # Save the newest entry ID
-        save_last_id(entries[0].id)
+    # Process oldest first for chronological order
+    for entry in reversed(new_entries):
+        twitter_url = nitter_to_twitter(entry.link)
+
+        # Log timing info to diagnose delays
+        tweet_time = entry.get('published_parsed')
+        now_dt = datetime.now()
+        if tweet_time:
+            tweet_dt = datetime(*tweet_time[:6])
+            lag_seconds = int((now_dt - tweet_dt).total_seconds())
+            log.info("[🕐] Tweet: %s | Sent: %s | Lag: %ss", tweet_dt.strftime('%H:%M:%S'), now_dt.strftime('%H:%M:%S'), lag_seconds)
+        else:
+            log.info("[🕐] Tweet time: unknown | Sent: %s", now_dt.strftime('%H:%M:%S'))
 
-    except Exception as e:
-        print(f"[!] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # Post the tweet right away; analysis is threaded under it by analysis_worker
+        message = await channel.send(twitter_url)
+        log.info("[✓] Sent: %s", twitter_url)
+
+        if SENTIMENT_ENABLED:
+            await analysis_queue.put((message, entry))
+
+    # Remember the current feed's IDs plus older ones, newest first
+    current_ids = [tweet_key(entry.id) for entry in entries]
+    current = set(current_ids)
+    older_ids = [i for i in seen_ids if i not in current]
+    save_seen_ids((current_ids + older_ids)[:seen_limit])
+
+    newest_time = new_entries[0].get('published_parsed')
+    update_poll_interval(calendar.timegm(newest_time) if newest_time else time.time())
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Send all log records through a queue so the event loop never blocks on stdout.
+
+    A QueueHandler on the root logger only enqueues records; a QueueListener
+    thread formats and writes them. discord.py's own logs go the same way.
+
+    Returns:
+        The started listener (stop it on shutdown to flush remaining records)
+    """
+    log_queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 def main():
     """Start the Discord bot."""
-    if not DISCORD_BOT_TOKEN:
-        print("[!] DISCORD_BOT_TOKEN not set in environment")
-        return
-    if not DISCORD_CHANNEL_ID:
-        print("[!] DISCORD_CHANNEL_ID not set in environment")
-        return
-    if not GROQ_API_KEY:
-        print("[!] GROQ_API_KEY not set in environment")
-        return
+    listener = setup_logging()
+    try:
+        if not DISCORD_BOT_TOKEN:
+            log.error("[!] DISCORD_BOT_TOKEN not set in environment")
+            return
+        if not DISCORD_CHANNEL_ID:
+            log.error("[!] DISCORD_CHANNEL_ID not set in environment")
+            return
+        if not GROQ_API_KEY:
+            log.error("[!] GROQ_API_KEY not set in environment")
+            return
+
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            log.info("Event loop: uvloop")
 
-    client.run(DISCORD_BOT_TOKEN)
+        # log_handler=None: logging is already configured above
+        client.run(DISCORD_BOT_TOKEN, log_handler=None)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":